@@ -31,6 +31,7 @@ class MCQAgent(Agent):
         self._translations = {
             lang: gettext.translation('messages', get_root_path() + '/agent/mcq_agent/i18n', [lang]) for lang in languages
         }
+        self._null_translation = gettext.NullTranslations()
 
     @property
     def environments(self):
@@ -47,7 +48,7 @@ class MCQAgent(Agent):
             raise CannotCreateJobException("Task is not available on this agent")
 
         language = msg.inputdata.get("@lang", "")
-        translation = self._translations.get(language, gettext.NullTranslations())
+        translation = self._translations.get(language, self._null_translation)
         _ = translation.gettext
 
         result, need_emul, text, problems, error_count, mcq_error_count = task.check_answer(msg.inputdata, language)
@@ -14,14 +14,18 @@ import inginious.common.custom_yaml
 from collections import OrderedDict
 
 
+_id_regex = re.compile(r'[a-z0-9\-_]+$', re.IGNORECASE)
+_id_tests_regex = re.compile(r'[a-z0-9\-_*]+$', re.IGNORECASE)
+
+
 def id_checker(id_to_test):
     """Checks if a id is correct"""
-    return bool(re.match(r'[a-z0-9\-_]+$', id_to_test, re.IGNORECASE))
+    return bool(_id_regex.match(id_to_test))
 
 
 def id_checker_tests(id_to_test):
     """Checks if a id is correct"""
-    return bool(re.match(r'[a-z0-9\-_*]+$', id_to_test, re.IGNORECASE))
+    return bool(_id_tests_regex.match(id_to_test))
     
 
 def load_json_or_yaml(file_path):
@@ -8,6 +8,10 @@
 import copy
 import gettext
 
+# Returned for languages the course is not translated in
+_null_translations = gettext.NullTranslations()
+
+
 class Course(object):
     """ Represents a course """
 
@@ -31,10 +35,10 @@ class Course(object):
                 if translations_fs.exists(lang + ".mo"):
                     self._translations[lang] = gettext.GNUTranslations(translations_fs.get_fd(lang + ".mo"))
                 else:
-                    self._translations[lang] = gettext.NullTranslations()
+                    self._translations[lang] = _null_translations
 
     def get_translation_obj(self, language):
-        return self._translations.get(language, gettext.NullTranslations())
+        return self._translations.get(language, _null_translations)
 
     def gettext(self, language, *args, **kwargs):
         return self.get_translation_obj(language).gettext(*args, **kwargs)
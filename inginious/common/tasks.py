@@ -5,9 +5,29 @@
 
 """ Task """
 import gettext
+import weakref
 
 from inginious.common.base import id_checker
 
+# Returned for languages the task is not translated in, instead of building a new one on each call
+_null_translations = gettext.NullTranslations()
+
+# Relative cost of the consistency check of a problem, given its input type
+_input_check_cost = {str: 0, list: 1, dict: 2}
+
+# Catalogs loaded by the tasks, shared by all the tasks using the same file (such as the ones in $common/$i18n)
+_catalogs = weakref.WeakValueDictionary()
+
+
+def _load_catalog(translations_fs, filename):
+    """ Returns the GNUTranslations stored in filename, reusing the one already loaded by another task if any """
+    key = (translations_fs.prefix, filename, translations_fs.get_last_modification_time(filename))
+    catalog = _catalogs.get(key)
+    if catalog is None:
+        catalog = gettext.GNUTranslations(translations_fs.get_fd(filename))
+        _catalogs[key] = catalog
+    return catalog
+
 
 class Task(object):
     """ Contains the data for a task """
@@ -61,27 +81,30 @@ class Task(object):
             for f in translations_fs.list(folders=False, files=True, recursive=False):
                 lang = f[0:len(f) - 3]
                 if translations_fs.exists(lang + ".mo"):
-                    self._translations[lang] = gettext.GNUTranslations(translations_fs.get_fd(lang + ".mo"))
+                    self._translations[lang] = _load_catalog(translations_fs, lang + ".mo")
                 else:
-                    self._translations[lang] = gettext.NullTranslations()
+                    self._translations[lang] = _null_translations
 
         # Check all problems
         self._problems = []
         for problemid in self._data['problems']:
             self._problems.append(self._create_task_problem(problemid, self._data['problems'][problemid], task_problem_types))
 
+        # Order in which inputs are checked: text inputs first, file uploads last, so that inconsistent inputs are rejected early
+        self._problems_check_order = sorted(self._problems, key=lambda problem: _input_check_cost.get(problem.input_type(), 1))
+
         # Order
         self._order = int(self._data.get('order', -1))
 
     def get_translation_obj(self, language):
-        return self._translations.get(language, gettext.NullTranslations())
+        return self._translations.get(language, _null_translations)
 
     def gettext(self, language, *args, **kwargs):
         return self.get_translation_obj(language).gettext(*args, **kwargs)
 
     def input_is_consistent(self, task_input, default_allowed_extension, default_max_size):
         """ Check if an input for a task is consistent. Return true if this is case, false else """
-        for problem in self._problems:
+        for problem in self._problems_check_order:
             if not problem.input_is_consistent(task_input, default_allowed_extension, default_max_size):
                 return False
         return True
@@ -177,7 +200,8 @@ class Task(object):
         # Basic checks
         if not id_checker(problemid):
             raise Exception("Invalid problem _id: " + problemid)
-        if problem_content.get('type', "") not in task_problem_types:
+        problem_type = task_problem_types.get(problem_content.get('type', ""))
+        if problem_type is None:
             raise Exception("Invalid type for problem " + problemid)
 
-        return task_problem_types.get(problem_content.get('type', ""))(self, problemid, problem_content)
+        return problem_type(self, problemid, problem_content)
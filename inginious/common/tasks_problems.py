@@ -11,10 +11,32 @@ from abc import ABCMeta, abstractmethod
 
 from inginious.common.base import id_checker
 
+_language_regex = re.compile(r'[a-z0-9\-_\.]+$', re.IGNORECASE)
+
+# Text fields of the problems, returned by get_text_fields. Shared by all callers: must not be modified
+_text_fields = {"name": True}
+_header_text_fields = dict(_text_fields, header=True)
+_multiple_choice_text_fields = dict(_header_text_fields, success_message=True, error_message=True,
+                                    choices=[{"text": True, "feedback": True}])
+
+
+def _as_index(value):
+    """ Returns value as a choice index if it is an int or a string of (at most 18) decimal digits, None else """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = value.strip()
+        # longer strings cannot be a choice index, and may exceed the int conversion limit of Python
+        if len(value) <= 18 and value.isdecimal():
+            return int(value)
+    return None
+
 
 class Problem(object, metaclass=ABCMeta):
     """Basic problem """
 
+    __slots__ = ("_id", "_task", "_name", "_original_content")
+
     @classmethod
     @abstractmethod
     def get_type(cls):
@@ -46,8 +68,8 @@ class Problem(object, metaclass=ABCMeta):
     @abstractmethod
     def get_text_fields(cls):
         """ Returns a dict whose keys are the keys of content dict
-        and val is True if value of content[key] is human-readable text """
-        return {"name": True}
+        and val is True if value of content[key] is human-readable text. The returned dict must not be modified """
+        return _text_fields
 
     def get_id(self):
         """ Get the id of this problem """
@@ -62,7 +84,12 @@ class Problem(object, metaclass=ABCMeta):
         return self.gettext(language, self._name) if self._name else ""
 
     def get_original_content(self):
-        """ Get a dict fully describing this sub-problem """
+        """ Get the dict fully describing this sub-problem. It is not copied and must not be modified:
+            use get_original_content_copy to get a modifiable dict """
+        return self._original_content
+
+    def get_original_content_copy(self):
+        """ Get a (shallow) copy of the dict fully describing this sub-problem """
         return dict(self._original_content)
 
     def __init__(self, task, problemid, content):
@@ -71,7 +98,7 @@ class Problem(object, metaclass=ABCMeta):
 
         self._id = problemid
         self._task = task
-        self._name = content['name'] if "name" in content else ""
+        self._name = content.get('name', "")
         self._original_content = content
 
     @classmethod
@@ -93,15 +120,18 @@ class Problem(object, metaclass=ABCMeta):
 class CodeProblem(Problem):
     """Code problem"""
 
+    __slots__ = ("_header", "_optional", "_language", "_default")
+
     def __init__(self, task, problemid, content):
         Problem.__init__(self, task, problemid, content)
-        self._header = content['header'] if "header" in content else ""
+        self._header = content.get('header', "")
         self._optional = content.get("optional", False)
 
-        if re.match(r'[a-z0-9\-_\.]+$', content.get("language", ""), re.IGNORECASE):
-            self._language = content.get("language", "")
-        elif content.get("language", ""):
-            raise Exception("Invalid language " + content["language"])
+        language = content.get("language", "")
+        if _language_regex.match(language):
+            self._language = language
+        elif language:
+            raise Exception("Invalid language " + language)
         else:
             self._language = "plain"
 
@@ -138,14 +168,14 @@ class CodeProblem(Problem):
 
     @classmethod
     def get_text_fields(cls):
-        fields = Problem.get_text_fields()
-        fields.update({"header": True})
-        return fields
+        return _header_text_fields
 
 
 class CodeSingleLineProblem(CodeProblem):
     """Code problem with a single line of input"""
 
+    __slots__ = ()
+
     @classmethod
     def get_type(cls):
         return "code_single_line"
@@ -154,9 +184,11 @@ class CodeSingleLineProblem(CodeProblem):
 class FileProblem(Problem):
     """File upload Problem"""
 
+    __slots__ = ("_header", "_max_size", "_allowed_exts")
+
     def __init__(self, task, problemid, content):
         Problem.__init__(self, task, problemid, content)
-        self._header = content['header'] if "header" in content else ""
+        self._header = content.get('header', "")
         self._max_size = content.get("max_size", None)
         self._allowed_exts = content.get("allowed_exts", None)
 
@@ -201,51 +233,57 @@ class FileProblem(Problem):
 
     @classmethod
     def get_text_fields(cls):
-        fields = Problem.get_text_fields()
-        fields.update({"header": True})
-        return fields
+        return _header_text_fields
 
 
 class MultipleChoiceProblem(Problem):
     """Multiple choice problems"""
 
+    __slots__ = ("_header", "_multiple", "_choices", "_choices_by_index", "_valid_mask", "_limit", "_centralize",
+                 "_error_message", "_success_message")
+
     def __init__(self, task, problemid, content):
         super(MultipleChoiceProblem, self).__init__(task, problemid, content)
-        self._header = content['header'] if "header" in content else ""
+        self._header = content.get('header', "")
         self._multiple = content.get("multiple", False)
         if "choices" not in content or not isinstance(content['choices'], list):
             raise Exception("Multiple choice problem " + problemid + " does not have choices or choices are not an array")
         good_choices = []
         bad_choices = []
+        self._choices_by_index = {}
+        # bit i is set iff the choice with index i is valid
+        self._valid_mask = 0
         for index, choice in enumerate(content["choices"]):
-            data = {"index": index}
             if "text" not in choice:
                 raise Exception("A choice in " + problemid + " does not have text")
-            data['text'] = choice["text"]
-            data['feedback'] = choice.get('feedback')
-            if choice.get('valid', False):
-                data['valid'] = True
+            valid = bool(choice.get('valid', False))
+            data = {"index": index, "text": choice["text"], "feedback": choice.get('feedback'), "valid": valid}
+            if valid:
                 good_choices.append(data)
+                self._valid_mask |= 1 << index
             else:
-                data['valid'] = False
                 bad_choices.append(data)
+            self._choices_by_index[index] = data
 
         if len(good_choices) == 0:
             raise Exception("Problem " + problemid + " does not have any valid answer")
 
         self._limit = 0
-        if "limit" in content and isinstance(content['limit'], int) and content['limit'] >= 0 and (not self._multiple or content['limit'] >= \
-                len(good_choices) or content['limit'] == 0):
-            self._limit = content['limit']
-        elif "limit" in content:
-            raise Exception("Invalid limit in problem " + problemid)
+        limit = content.get("limit")
+        if limit is not None:
+            if isinstance(limit, int) and limit >= 0 and (not self._multiple or limit >= len(good_choices) or limit == 0):
+                self._limit = limit
+            else:
+                raise Exception("Invalid limit in problem " + problemid)
 
         self._centralize = content.get("centralize", False)
 
         self._error_message = content.get("error_message", None)
         self._success_message = content.get("success_message", None)
 
-        self._choices = good_choices + bad_choices
+        # valid choices first, each group in the order of the description
+        good_choices.extend(bad_choices)
+        self._choices = good_choices
 
     @classmethod
     def get_type(cls):
@@ -257,52 +295,43 @@ class MultipleChoiceProblem(Problem):
 
     def get_choice_with_index(self, index):
         """ Return the choice with index=index """
-        for entry in self._choices:
-            if entry["index"] == index:
-                return entry
-        return None
+        return self._choices_by_index.get(index)
 
     def input_type(self):
         return list if self._multiple else str
 
     def input_is_consistent(self, task_input, default_allowed_extension, default_max_size):
-        if self.get_id() not in task_input:
+        if self._id not in task_input:
             return False
+        answer = task_input[self._id]
         if self._multiple:
-            if not isinstance(task_input[self.get_id()], list):
-                return False
-            try:  # test conversion to int
-                for entry in task_input[self.get_id()]:
-                    if self.get_choice_with_index(int(entry)) is None:
-                        return False
-            except ValueError:
+            if not isinstance(answer, list):
                 return False
-        else:
-            try:  # test conversion to int
-                if self.get_choice_with_index(int(task_input[self.get_id()])) is None:
+            for entry in answer:
+                if self._choices_by_index.get(_as_index(entry)) is None:
                     return False
-            except ValueError:
-                return False
+        elif self._choices_by_index.get(_as_index(answer)) is None:
+            return False
         return True
 
     def check_answer(self, task_input, language):
         valid = True
         msgs = []
         invalid_count = 0
+        answer = task_input[self._id]
         if self._multiple:
-            for choice in self._choices:
-                if choice["valid"] and not choice["index"] in task_input[self.get_id()] and not str(choice["index"]) in task_input[self.get_id()]:
-                    valid = False
-                    invalid_count += 1
-                elif not choice["valid"] and (choice["index"] in task_input[self.get_id()] or str(choice["index"]) in task_input[self.get_id()]):
-                    valid = False
-                    invalid_count += 1
-            for i in task_input[self.get_id()]:
-                feedback = self.get_choice_with_index(int(i))["feedback"]
+            # entries may be given as int or str: normalize them once
+            submitted = [int(entry) for entry in answer]
+            # each valid choice not checked and each invalid choice checked is an error
+            submitted_mask = sum(1 << index for index in set(submitted))
+            invalid_count = bin(self._valid_mask ^ submitted_mask).count("1")
+            valid = invalid_count == 0
+            for index in submitted:
+                feedback = self._choices_by_index[index]["feedback"]
                 if feedback is not None:
                     msgs.append(self.gettext(language, feedback))
         else:
-            choice = self.get_choice_with_index(int(task_input[self.get_id()]))
+            choice = self._choices_by_index[int(answer)]
             valid = choice["valid"]
             if not valid:
                 invalid_count += 1
@@ -353,17 +382,17 @@ class MultipleChoiceProblem(Problem):
 
     @classmethod
     def get_text_fields(cls):
-        fields = Problem.get_text_fields()
-        fields.update({"header": True, "success_message": True, "error_message": True, "choices": [{"text": True, "feedback": True}]})
-        return fields
+        return _multiple_choice_text_fields
 
 
 class MatchProblem(Problem):
     """Display an input box and check that the content is correct"""
 
+    __slots__ = ("_header", "_answer")
+
     def __init__(self, task, problemid, content):
         super(MatchProblem, self).__init__(task, problemid, content)
-        self._header = content['header'] if "header" in content else ""
+        self._header = content.get('header', "")
         if not "answer" in content:
             raise Exception("There is no answer in this problem with type==match")
         self._answer = str(content["answer"])
@@ -379,7 +408,9 @@ class MatchProblem(Problem):
         return str
 
     def check_answer(self, task_input, language):
-        if task_input[self.get_id()].strip() == self._answer:
+        answer = task_input[self._id]
+        # stripping can only shorten the input: inputs shorter than the answer cannot match
+        if len(answer) >= len(self._answer) and answer.strip() == self._answer:
             return True, None, ["_correct_answer"], 0
         else:
             return False, None, ["_wrong_answer"], 0
@@ -390,6 +421,4 @@ class MatchProblem(Problem):
 
     @classmethod
     def get_text_fields(cls):
-        fields = Problem.get_text_fields()
-        fields.update({"header": True})
-        return fields
+        return _header_text_fields
@@ -3,6 +3,8 @@
 # This file is part of INGInious. See the LICENSE and the COPYRIGHTS files for
 # more information about the licensing of this file.
 
+import copy
+import json
 import os
 
 import inginious.common.base
@@ -144,11 +146,48 @@ class test_tasks_problems(object):
         assert p.check_answer({'unittest': [0, 1]}, "")[0]
         assert not p.check_answer({'unittest': [0, 1, 2]}, "")[0]
 
+        # Check the number of errors, for both int and str form input
+        assert p.check_answer({'unittest': ["0", "1"]}, "")[3] == 0
+        assert p.check_answer({'unittest': ["0", "2", "3"]}, "")[3] == 3
+        assert p.check_answer({'unittest': [2]}, "")[3] == 3
+
         # Check random form input
         assert p.input_is_consistent({'unittest': [0, 1]}, [], 0)
+        assert p.input_is_consistent({'unittest': ["0", "3"]}, [], 0)
+        assert not p.input_is_consistent({'unittest': ["0", "4"]}, [], 0)
+        assert not p.input_is_consistent({'unittest': ["0", "a"]}, [], 0)
+        assert not p.input_is_consistent({'unittest': [None]}, [], 0)
+        assert not p.input_is_consistent({'unittest': ["9" * 5000]}, [], 0)
+        assert not p.input_is_consistent({'unittest': ["0" * 5000 + "1"]}, [], 0)
+        assert not p.input_is_consistent({'unittest': "0"}, [], 0)
         assert not p.input_is_consistent('test', [], 0)
         assert not p.input_is_consistent((10, 42), [], 0)
 
+    def test_single_choice(self):
+        '''Tests multiple choice problems allowing only one answer'''
+        task = self.course_factory.get_task('test2', 'task3')
+        p = MultipleChoiceProblem(task, 'unittest', {"choices": [{"text": "A", "valid": True}, {"text": "B"}]})
+        assert not p.allow_multiple()
+
+        assert p.input_is_consistent({'unittest': "1"}, [], 0)
+        assert not p.input_is_consistent({'unittest': "2"}, [], 0)
+        assert not p.input_is_consistent({'unittest': "a"}, [], 0)
+        assert not p.input_is_consistent({'unittest': "9" * 5000}, [], 0)
+        assert p.check_answer({'unittest': "0"}, "")[0]
+        assert not p.check_answer({'unittest': "1"}, "")[0]
+
+    def test_original_content(self):
+        '''Tests that problems can be copied and their content serialized'''
+        p = self.course_factory.get_task('test2', 'task3').get_problems()[0]
+        p2 = copy.deepcopy(p)
+        assert p2.get_original_content() == p.get_original_content()
+        assert p2.check_answer({'unittest': [0, 1]}, "")[0]
+
+        content = p.get_original_content_copy()
+        assert json.loads(json.dumps(content)) == content
+        content["id"] = "unittest"
+        assert "id" not in p.get_original_content()
+
     def test_match(self):
         '''Tests match problems methods'''
         print("\033[1m-> common-tasks: match-problem loading\033[0m")
@@ -157,6 +196,8 @@ class test_tasks_problems(object):
         # Check correct and incorrect answer
         assert p.check_answer({'unittest': 'Answer 1'}, "")[0]
         assert not p.check_answer({'unittest': 'Wrong answer'}, "")[0]
+        assert p.check_answer({'unittest': '  Answer 1\n'}, "")[0]
+        assert not p.check_answer({'unittest': 'Answer'}, "")[0]
 
         # Check random form input
         assert p.input_is_consistent({'unittest': 'Answer'}, [], 0)
@@ -31,7 +31,11 @@ def _get_submissions(course_factory, submission_manager, user_manager, translati
         raise APINotFound("Task not found")
 
     if submissionid is None:
-        submissions = submission_manager.get_user_submissions(task)
+        # Only retrieve the fields that are displayed (and the reference to the input if needed)
+        projection = {"submitted_on": 1, "status": 1, "grade": 1, "result": 1, "text": 1, "problems": 1, "response_type": 1}
+        if with_input:
+            projection["input"] = 1
+        submissions = submission_manager.get_user_submissions(task, projection)
     else:
         try:
             submissions = [submission_manager.get_submission(submissionid)]
@@ -180,10 +184,7 @@ class APISubmissions(APIAuthenticatedPage):
         if not self.user_manager.task_can_user_submit(task, username, False):
             raise APIForbidden("You are not allowed to submit for this task")
 
-        init_var = {
-            problem.get_id(): problem.input_type()()
-            for problem in task.get_problems() if problem.input_type() in [dict, list]
-        }
+        init_var = task.get_input_defaults()
         user_input = task.adapt_input_for_backend(web.input(**init_var))
 
         if not task.input_is_consistent(user_input, self.default_allowed_file_extensions, self.default_max_file_size):
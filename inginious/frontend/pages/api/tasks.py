@@ -89,7 +89,7 @@ class APITasks(APIAuthenticatedPage):
             }
 
             for problem in task.get_problems():
-                pcontent = problem.get_original_content()
+                pcontent = problem.get_original_content_copy()
                 pcontent["id"] = problem.get_id()
                 if pcontent["type"] == "match":
                     del pcontent["answer"]
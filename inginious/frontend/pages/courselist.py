@@ -22,11 +22,13 @@ class CourseListPage(INGIniousPage):
     def show_page(self):
         """  Display main course list page """
         username = self.user_manager.session_username()
-        user_info = self.database.users.find_one({"username": username})
+        language = self.user_manager.session_language()
+        # Only the fields needed by the registration access control are fetched
+        user_info = self.database.users.find_one({"username": username}, {"username": 1, "email": 1, "bindings": 1})
         all_courses = self.course_factory.get_all_courses()
 
-        # Display
-        open_courses = {courseid: course for courseid, course in all_courses.items() if course.is_open_to_non_staff()}
-        open_courses = OrderedDict(sorted(iter(open_courses.items()), key=lambda x: x[1].get_name(self.user_manager.session_language())))
+        # Display: filter and sort the courses without intermediate dict
+        open_courses = OrderedDict(sorted(((courseid, course) for courseid, course in all_courses.items() if course.is_open_to_non_staff()),
+                                          key=lambda x: x[1].get_name(language)))
 
         return self.template_helper.get_renderer().index(open_courses, user_info)
@@ -207,10 +207,7 @@ class BaseTaskPage(object):
                     return json.dumps({"status": "error", "text": _("Your task has been regenerated. This current task is outdated.")})
 
             # Reparse user input with array for multiple choices
-            init_var = {
-                problem.get_id(): problem.input_type()()
-                for problem in task.get_problems() if problem.input_type() in [dict, list]
-            }
+            init_var = task.get_input_defaults()
             userinput = task.adapt_input_for_backend(web.input(**init_var))
 
             if not task.input_is_consistent(userinput, self.default_allowed_file_extensions, self.default_max_file_size):
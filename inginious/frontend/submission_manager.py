@@ -414,13 +414,13 @@ class WebAppSubmissionManager:
 
         return self._user_manager.session_username() in submission["username"]
 
-    def get_user_submissions(self, task):
-        """ Get all the user's submissions for a given task """
+    def get_user_submissions(self, task, projection=None):
+        """ Get all the user's submissions for a given task. If projection is not None, only the given fields are retrieved """
         if not self._user_manager.session_logged_in():
             raise Exception("A user must be logged in to get his submissions")
 
         cursor = self._database.submissions.find({"username": self._user_manager.session_username(),
-                                                  "taskid": task.get_id(), "courseid": task.get_course_id()})
+                                                  "taskid": task.get_id(), "courseid": task.get_course_id()}, projection)
         cursor.sort([("submitted_on", -1)])
         return list(cursor)
 
@@ -19,6 +19,8 @@ from inginious.frontend.parsable_text import ParsableText
 class DisplayableProblem(Problem, metaclass=ABCMeta):
     """Basic problem """
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def get_type_name(self, gettext):
@@ -53,6 +55,8 @@ class DisplayableProblem(Problem, metaclass=ABCMeta):
 class DisplayableCodeProblem(CodeProblem, DisplayableProblem):
     """ A basic class to display all BasicCodeProblem derivatives """
 
+    __slots__ = ()
+
     def __init__(self, task, problemid, content):
         super(DisplayableCodeProblem, self).__init__(task, problemid, content)
 
@@ -81,6 +85,8 @@ class DisplayableCodeProblem(CodeProblem, DisplayableProblem):
 class DisplayableCodeSingleLineProblem(CodeSingleLineProblem, DisplayableProblem):
     """ A displayable single code line problem """
 
+    __slots__ = ()
+
     def __init__(self, task, problemid, content):
         super(DisplayableCodeSingleLineProblem, self).__init__(task, problemid, content)
 
@@ -110,6 +116,8 @@ class DisplayableCodeSingleLineProblem(CodeSingleLineProblem, DisplayableProblem
 class DisplayableFileProblem(FileProblem, DisplayableProblem):
     """ A displayable code problem """
 
+    __slots__ = ()
+
     def __init__(self, task, problemid, content):
         super(DisplayableFileProblem, self).__init__(task, problemid, content)
 
@@ -143,6 +151,8 @@ class DisplayableFileProblem(FileProblem, DisplayableProblem):
 class DisplayableMultipleChoiceProblem(MultipleChoiceProblem, DisplayableProblem):
     """ A displayable multiple choice problem """
 
+    __slots__ = ()
+
     def __init__(self, task, problemid, content):
         super(DisplayableMultipleChoiceProblem, self).__init__(task, problemid, content)
 
@@ -210,6 +220,8 @@ class DisplayableMultipleChoiceProblem(MultipleChoiceProblem, DisplayableProblem
 class DisplayableMatchProblem(MatchProblem, DisplayableProblem):
     """ A displayable match problem """
 
+    __slots__ = ()
+
     def __init__(self, task, problemid, content):
         super(DisplayableMatchProblem, self).__init__(task, problemid, content)
 
@@ -61,6 +61,10 @@ class WebAppTask(Task):
         # Category tags
         self._categories = self._data.get("categories", [])
 
+        # Types of the inputs that cannot be given as a single string by web.py
+        self._input_defaults_types = [(problem.get_id(), problem.input_type()) for problem in self._problems
+                                      if problem.input_type() in [dict, list]]
+
     def get_grading_weight(self):
         """ Get the relative weight of this task in the grading """
         return self._weight
@@ -113,6 +117,10 @@ class WebAppTask(Task):
             input_data = problem.adapt_input_for_backend(input_data)
         return input_data
 
+    def get_input_defaults(self):
+        """ Returns the default values to give to web.input for the problems whose input is a dict or a list """
+        return {problemid: input_type() for problemid, input_type in self._input_defaults_types}
+
     def get_stored_submissions(self):
         """ Indicates if only the last submission must be stored for the task """
         return self._stored_submissions